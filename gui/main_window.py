@@ -119,11 +119,18 @@ class ProcessingThread(QThread):
     def run(self):
         try:
             self.progress.emit("처리 시작...")
-            stats = self.processor.process_folder(
+            # 이미지별 결과를 받아 진행 상황을 로그로 전달
+            for result in self.processor.iter_process(
                 self.input_folder,
                 self.output_folder,
                 cancel_check=lambda: self._cancelled
-            )
+            ):
+                name = Path(result["input_path"]).name
+                if result["success"]:
+                    self.progress.emit(f"{name}: 얼굴 {result['face_count']}개 처리")
+                else:
+                    self.progress.emit(f"{name}: 처리 실패")
+            stats = self.processor.stats
             if self._cancelled:
                 self.progress.emit("처리가 취소되었습니다.")
             self.finished.emit(stats)
@@ -0,0 +1,179 @@
+"""
+얼굴 감지 결과 캐시 모듈
+
+파일 내용 해시와 감지기 설정을 키로 감지 결과(바운딩 박스)를 SQLite에 저장하여,
+같은 이미지를 다른 모자이크/로고 설정으로 다시 처리할 때 감지를 생략합니다.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 기본 캐시 위치: ~/.face-mosaic-local/detect_cache.sqlite3
+CONFIG_DIR_NAME = ".face-mosaic-local"
+CACHE_FILENAME = "detect_cache.sqlite3"
+
+
+def default_cache_path() -> Path:
+    """기본 감지 캐시 파일 경로를 반환합니다."""
+    return Path.home() / CONFIG_DIR_NAME / CACHE_FILENAME
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    파일 내용의 SHA-256 해시를 계산합니다.
+
+    Args:
+        path: 파일 경로
+        chunk_size: 한 번에 읽을 바이트 수
+
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def detector_fingerprint(detector_type: str, params: Dict) -> str:
+    """
+    감지기 타입과 파라미터로 캐시 키 접미사를 만듭니다.
+
+    Args:
+        detector_type: 감지기 타입 ('haar' 또는 'dnn')
+        params: 감지 결과에 영향을 주는 감지기 파라미터
+
+    Returns:
+        정렬된 JSON 문자열
+    """
+    return json.dumps({"detector": detector_type, "params": params}, sort_keys=True, default=list)
+
+
+class DetectionCache:
+    """SQLite 기반 감지 결과 캐시 (크기 기반 LRU 제거)"""
+
+    # 이 횟수만큼 기록할 때마다 최대 크기 확인
+    EVICT_INTERVAL = 64
+
+    def __init__(self, path: Optional[str] = None, max_size_mb: float = 256.0):
+        """
+        캐시 초기화.
+
+        Args:
+            path: 캐시 파일 경로 (None이면 ~/.face-mosaic-local/detect_cache.sqlite3)
+            max_size_mb: 저장된 감지 결과의 최대 크기 (MB), 초과 시 오래 사용하지 않은 항목부터 제거
+        """
+        self.path = Path(path) if path else default_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+
+        # 파이프라인 감지 스레드에서 공유하므로 잠금으로 보호
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+
+        # 여러 프로세서/워커 프로세스가 같은 파일을 열 수 있도록 WAL 모드와 대기 시간 설정.
+        # 쓰기 트랜잭션을 열어 둔 채로 두면 다른 연결이 잠금을 기다리므로 자동 커밋을 사용
+        # (WAL + synchronous=NORMAL에서는 커밋 시 fsync가 없어 비용이 작음)
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS detections ("
+            "key TEXT PRIMARY KEY, "
+            "boxes TEXT NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON detections(last_used)")
+
+    @staticmethod
+    def make_key(content_hash: str, fingerprint: str) -> str:
+        """파일 내용 해시와 감지기 설정으로 캐시 키를 만듭니다."""
+        return hashlib.sha256(f"{content_hash}|{fingerprint}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Tuple[int, int, int, int]]]:
+        """
+        캐시된 감지 결과를 조회합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            바운딩 박스 리스트, 없으면 None
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT boxes FROM detections WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE detections SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._after_write()
+        return [tuple(box) for box in json.loads(row[0])]
+
+    def put(self, key: str, boxes: List[Tuple[int, int, int, int]]) -> None:
+        """
+        감지 결과를 저장합니다.
+
+        Args:
+            key: 캐시 키
+            boxes: 바운딩 박스 리스트 [(x, y, width, height), ...]
+        """
+        payload = json.dumps([[int(v) for v in box] for box in boxes])
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO detections (key, boxes, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, payload, len(key) + len(payload), time.time())
+            )
+            self._after_write()
+
+    def _after_write(self) -> None:
+        """일정 횟수마다 최대 크기를 확인합니다 (잠금 보유 상태)."""
+        self._writes_since_evict += 1
+        if self._writes_since_evict >= self.EVICT_INTERVAL:
+            self._evict()
+            self._writes_since_evict = 0
+
+    def _evict(self) -> None:
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다 (잠금 보유 상태)."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM detections").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        # 제거 후 여유를 두기 위해 최대 크기의 90%까지 줄임
+        excess = total - int(self.max_size_bytes * 0.9)
+        stale = []
+        for key, size in self._conn.execute("SELECT key, size FROM detections ORDER BY last_used"):
+            stale.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        with self._conn:
+            self._conn.executemany("DELETE FROM detections WHERE key = ?", stale)
+
+    def total_size(self) -> int:
+        """저장된 항목의 총 크기 (bytes)를 반환합니다."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM detections").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM detections").fetchone()[0]
+
+    def flush(self) -> None:
+        """최대 크기를 확인하고 넘으면 항목을 제거합니다."""
+        with self._lock:
+            self._evict()
+            self._writes_since_evict = 0
+
+    def close(self) -> None:
+        """크기를 정리하고 연결을 닫습니다."""
+        self.flush()
+        with self._lock:
+            self._conn.close()
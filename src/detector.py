@@ -6,7 +6,7 @@ Haar Cascade와 DNN 두 가지 방식을 지원합니다.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from pathlib import Path
 import cv2
 import numpy as np
@@ -15,6 +15,18 @@ import numpy as np
 class FaceDetector(ABC):
     """얼굴 감지기 베이스 클래스"""
     
+    # 감지기 타입 이름 (get_detector의 detector_type과 동일)
+    name: str = ""
+    
+    def get_params(self) -> Dict:
+        """
+        감지 결과에 영향을 주는 파라미터를 반환합니다 (감지 캐시 키에 사용).
+        
+        Returns:
+            파라미터 딕셔너리
+        """
+        return {}
+    
     @abstractmethod
     def detect(self, image: np.ndarray) -> List[Tuple[int, int, int, int]]:
         """
@@ -27,11 +39,28 @@ class FaceDetector(ABC):
             얼굴 바운딩 박스 리스트 [(x, y, width, height), ...]
         """
         pass
+    
+    def detect_batch(self, images: List[np.ndarray]) -> List[List[Tuple[int, int, int, int]]]:
+        """
+        여러 이미지에서 얼굴을 감지합니다.
+        
+        기본 구현은 이미지마다 detect()를 호출합니다.
+        배치 추론을 지원하는 감지기는 이 메서드를 재정의합니다.
+        
+        Args:
+            images: 입력 이미지 리스트 (BGR 형식)
+        
+        Returns:
+            이미지별 얼굴 바운딩 박스 리스트 (입력 순서와 동일)
+        """
+        return [self.detect(image) for image in images]
 
 
 class HaarCascadeDetector(FaceDetector):
     """Haar Cascade 기반 얼굴 감지기"""
     
+    name = "haar"
+    
     def __init__(self, scale_factor: float = 1.1, min_neighbors: int = 5, min_size: Tuple[int, int] = (30, 30)):
         """
         Haar Cascade 감지기 초기화.
@@ -51,6 +80,14 @@ class HaarCascadeDetector(FaceDetector):
         self.min_neighbors = min_neighbors
         self.min_size = min_size
     
+    def get_params(self) -> Dict:
+        """감지 결과에 영향을 주는 파라미터를 반환합니다."""
+        return {
+            "scale_factor": self.scale_factor,
+            "min_neighbors": self.min_neighbors,
+            "min_size": list(self.min_size),
+        }
+    
     def detect(self, image: np.ndarray) -> List[Tuple[int, int, int, int]]:
         """
         Haar Cascade를 사용하여 얼굴을 감지합니다.
@@ -76,6 +113,8 @@ class HaarCascadeDetector(FaceDetector):
 class DNNDetector(FaceDetector):
     """DNN 기반 얼굴 감지기 (SSD + ResNet)"""
     
+    name = "dnn"
+    
     def __init__(self, confidence_threshold: float = 0.5, model_dir: str = "models"):
         """
         DNN 감지기 초기화.
@@ -111,6 +150,13 @@ class DNNDetector(FaceDetector):
         self.scale_factor = 1.0
         self.mean = (104.0, 177.0, 123.0)  # BGR 평균값
     
+    def get_params(self) -> Dict:
+        """감지 결과에 영향을 주는 파라미터를 반환합니다."""
+        return {
+            "confidence_threshold": self.confidence_threshold,
+            "input_size": list(self.input_size),
+        }
+    
     def detect(self, image: np.ndarray) -> List[Tuple[int, int, int, int]]:
         """
         DNN을 사용하여 얼굴을 감지합니다.
@@ -135,14 +181,68 @@ class DNNDetector(FaceDetector):
         self.net.setInput(blob)
         detections = self.net.forward()
         
+        return self._parse_detections(detections[0, 0], w, h)
+    
+    def detect_batch(self, images: List[np.ndarray]) -> List[List[Tuple[int, int, int, int]]]:
+        """
+        DNN 배치 추론으로 여러 이미지에서 얼굴을 감지합니다.
+        
+        blobFromImages로 N장을 하나의 blob으로 만들어 forward를 1회만 호출하고,
+        각 감지 결과는 해당 이미지의 너비/높이로 픽셀 좌표로 변환합니다.
+        
+        Args:
+            images: 입력 이미지 리스트 (BGR 형식)
+        
+        Returns:
+            이미지별 얼굴 바운딩 박스 리스트 (입력 순서와 동일)
+        """
+        if not images:
+            return []
+        if len(images) == 1:
+            return [self.detect(images[0])]
+        
+        # blob 생성 (N x 3 x H x W)
+        blob = cv2.dnn.blobFromImages(
+            images,
+            scalefactor=self.scale_factor,
+            size=self.input_size,
+            mean=self.mean
+        )
+        
+        self.net.setInput(blob)
+        detections = self.net.forward()
+        
+        # 감지 결과의 첫 번째 열은 배치 내 이미지 인덱스
+        rows = detections[0, 0]
+        image_ids = rows[:, 0].astype(int)
+        
+        results = []
+        for index, image in enumerate(images):
+            h, w = image.shape[:2]
+            results.append(self._parse_detections(rows[image_ids == index], w, h))
+        
+        return results
+    
+    def _parse_detections(self, rows: np.ndarray, w: int, h: int) -> List[Tuple[int, int, int, int]]:
+        """
+        SSD 출력 행 [image_id, label, confidence, x1, y1, x2, y2]을 픽셀 좌표 박스로 변환합니다.
+        
+        Args:
+            rows: 감지 결과 행 배열 (K x 7)
+            w: 원본 이미지 너비
+            h: 원본 이미지 높이
+        
+        Returns:
+            얼굴 바운딩 박스 리스트 [(x, y, width, height), ...]
+        """
         faces = []
-        for i in range(detections.shape[2]):
-            confidence = detections[0, 0, i, 2]
+        for i in range(rows.shape[0]):
+            confidence = rows[i, 2]
             
             # 신뢰도 임계값 이상인 경우만 처리
             if confidence > self.confidence_threshold:
                 # 바운딩 박스 좌표 계산 (0.0 ~ 1.0 → 픽셀 좌표)
-                box = detections[0, 0, i, 3:7] * np.array([w, h, w, h])
+                box = rows[i, 3:7] * np.array([w, h, w, h])
                 x, y, x2, y2 = box.astype(int)
                 
                 # width, height로 변환
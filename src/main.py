@@ -6,6 +6,7 @@ Face Mosaic Local - CLI 진입점
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -34,6 +35,12 @@ def parse_args() -> argparse.Namespace:
 
   # 신뢰도 임계값 조절
   python -m src.main --input ./photos --output ./output --confidence 0.7
+
+  # 중단된 작업 이어서 처리 (이미 최신인 출력은 건너뜀)
+  python -m src.main --input ./photos --output ./output --resume
+
+  # 4개 프로세스로 병렬 처리
+  python -m src.main --input ./photos --output ./output --jobs 4
         """
     )
     
@@ -83,6 +90,33 @@ def parse_args() -> argparse.Namespace:
         help="DNN 감지기 신뢰도 임계값 (0.0 ~ 1.0, 기본값: 0.5)"
     )
     
+    parser.add_argument(
+        "--detect-batch",
+        type=int,
+        default=1,
+        help="감지기에 한 번에 전달할 이미지 수 (DNN 배치 추론, 기본값: 1)"
+    )
+    
+    parser.add_argument(
+        "--no-detect-cache",
+        action="store_true",
+        help="감지 결과 캐시 사용 안 함 (기본: ~/.face-mosaic-local 에 캐시)"
+    )
+    
+    parser.add_argument(
+        "--detect-cache-path",
+        type=str,
+        default=None,
+        help="감지 캐시 파일 경로 (기본값: ~/.face-mosaic-local/detect_cache.sqlite3)"
+    )
+    
+    parser.add_argument(
+        "--detect-cache-size",
+        type=float,
+        default=256.0,
+        help="감지 캐시 최대 크기 (MB, 기본값: 256)"
+    )
+    
     parser.add_argument(
         "--blur-kernel-size",
         type=int,
@@ -103,6 +137,54 @@ def parse_args() -> argparse.Namespace:
         help="하위 폴더까지 재귀적으로 처리"
     )
     
+    parser.add_argument(
+        "--resume", "--incremental",
+        dest="incremental",
+        action="store_true",
+        help="매니페스트 기준으로 현재 설정의 출력이 최신인 이미지는 건너뜀 (중단된 작업 이어서 처리)"
+    )
+    
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="병렬 처리 프로세스 수 (0이면 CPU 코어 수, 기본값: 1)"
+    )
+    
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="디코드/감지/인코드 단계를 겹쳐 실행하는 파이프라인 모드 (--jobs 1일 때)"
+    )
+    
+    parser.add_argument(
+        "--read-threads",
+        type=int,
+        default=2,
+        help="파이프라인 디코드 단계 스레드 수 (기본값: 2)"
+    )
+    
+    parser.add_argument(
+        "--detect-threads",
+        type=int,
+        default=1,
+        help="파이프라인 감지/렌더링 단계 스레드 수 (기본값: 1)"
+    )
+    
+    parser.add_argument(
+        "--write-threads",
+        type=int,
+        default=2,
+        help="파이프라인 인코드 단계 스레드 수 (기본값: 2)"
+    )
+    
+    parser.add_argument(
+        "--queue-depth",
+        type=int,
+        default=8,
+        help="파이프라인 단계 사이 큐 크기 (메모리 상한, 기본값: 8)"
+    )
+    
     parser.add_argument(
         "--log-file",
         type=str,
@@ -166,6 +248,19 @@ def validate_args(args: argparse.Namespace) -> None:
     if args.blur_kernel_size < 1:
         raise ValueError(f"블러 커널 크기는 1 이상이어야 합니다: {args.blur_kernel_size}")
     
+    # 병렬 처리 프로세스 수 확인
+    if args.jobs < 0:
+        raise ValueError(f"프로세스 수는 0 이상이어야 합니다: {args.jobs}")
+    
+    # 파이프라인/배치 설정 확인
+    for name in ("read_threads", "detect_threads", "write_threads", "queue_depth", "detect_batch"):
+        if getattr(args, name) < 1:
+            raise ValueError(f"{name}은(는) 1 이상이어야 합니다: {getattr(args, name)}")
+    
+    # 감지 캐시 크기 확인
+    if args.detect_cache_size <= 0:
+        raise ValueError(f"감지 캐시 크기는 0보다 커야 합니다: {args.detect_cache_size}")
+    
     # 신뢰도 범위 확인
     if not (0.0 <= args.confidence <= 1.0):
         raise ValueError(f"신뢰도는 0.0-1.0 사이여야 합니다: {args.confidence}")
@@ -208,6 +303,12 @@ def main() -> int:
         logger.info(f"출력 폴더: {args.output}")
         logger.info(f"감지기: {args.detector}")
         logger.info(f"처리 방법: {args.method}")
+        jobs = args.jobs or os.cpu_count() or 1
+        logger.info(f"병렬 처리 프로세스 수: {jobs}")
+        if args.no_detect_cache:
+            logger.info("감지 결과 캐시 사용 안 함")
+        if args.pipeline:
+            logger.info("파이프라인 모드 사용")
         if args.logo:
             logger.info(f"로고 파일: {args.logo}")
             logger.info(f"로고 크기: {args.logo_size}")
@@ -230,14 +331,25 @@ def main() -> int:
             logo_path=args.logo,
             logo_scale=args.logo_size,
             logo_margin=args.logo_margin,
-            logo_opacity=args.logo_opacity
+            logo_opacity=args.logo_opacity,
+            workers=jobs,
+            pipeline=args.pipeline,
+            read_threads=args.read_threads,
+            detect_threads=args.detect_threads,
+            write_threads=args.write_threads,
+            queue_depth=args.queue_depth,
+            detect_batch_size=args.detect_batch,
+            detect_cache=not args.no_detect_cache,
+            detect_cache_path=args.detect_cache_path,
+            detect_cache_max_mb=args.detect_cache_size
         )
         
         # 폴더 처리
         stats = processor.process_folder(
             input_dir=args.input,
             output_dir=args.output,
-            recursive=args.recursive
+            recursive=args.recursive,
+            incremental=args.incremental
         )
         
         # 성공 여부 반환
@@ -0,0 +1,136 @@
+"""
+처리 매니페스트 모듈
+
+일괄 처리 중 완료된 이미지를 출력 폴더의 JSON Lines 파일에 추가 기록하여,
+중단된 작업을 이어서 처리하거나 변경된 파일만 다시 처리할 수 있게 합니다.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, IO, Optional
+
+# 출력 폴더에 저장되는 매니페스트 파일 이름
+MANIFEST_FILENAME = ".face_mosaic_manifest.jsonl"
+
+
+class ProcessingManifest:
+    """추가 전용(append-only) 처리 매니페스트"""
+
+    # 이 횟수만큼 기록할 때마다 파일 버퍼를 비움
+    FLUSH_INTERVAL = 32
+
+    def __init__(self, output_dir: str):
+        """
+        매니페스트 초기화.
+
+        Args:
+            output_dir: 출력 폴더 경로 (매니페스트 파일 위치)
+        """
+        self.path = Path(output_dir) / MANIFEST_FILENAME
+        self.entries: Dict[str, Dict] = {}
+        self._file: Optional[IO[str]] = None
+        self._pending = 0
+
+    def load(self) -> Dict[str, Dict]:
+        """
+        기존 매니페스트를 읽습니다. 같은 원본이 여러 번 기록된 경우 마지막 항목이 유효합니다.
+
+        중복 항목이 많으면 유효한 항목만 남기도록 파일을 다시 씁니다.
+
+        Returns:
+            원본 경로 → 항목 딕셔너리
+        """
+        self.entries = {}
+        if not self.path.exists():
+            return self.entries
+
+        lines = 0
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                    self.entries[entry["source"]] = entry
+                except (ValueError, KeyError):
+                    # 중단 시 마지막 줄이 잘렸을 수 있음
+                    continue
+
+        if lines > 2 * len(self.entries) + self.FLUSH_INTERVAL:
+            self._compact()
+
+        return self.entries
+
+    def _compact(self) -> None:
+        """유효한 항목만 남기도록 매니페스트를 다시 씁니다."""
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in self.entries.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def is_up_to_date(self, source: str, output: str, settings: str) -> bool:
+        """
+        원본의 출력이 현재 설정 기준으로 최신인지 확인합니다.
+
+        원본 크기/수정 시각, 설정 지문, 출력 경로가 모두 같고 출력 파일이 존재해야 합니다.
+
+        Args:
+            source: 원본 이미지 경로
+            output: 출력 이미지 경로
+            settings: 현재 처리 설정 지문
+
+        Returns:
+            최신 여부
+        """
+        entry = self.entries.get(source)
+        if entry is None:
+            return False
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return False
+        return (
+            entry.get("size") == stat.st_size
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("settings") == settings
+            and entry.get("output") == output
+            and os.path.exists(output)
+        )
+
+    def record(self, source: str, output: str, settings: str, faces: int) -> None:
+        """
+        처리 완료된 이미지를 매니페스트에 추가합니다.
+
+        Args:
+            source: 원본 이미지 경로
+            output: 출력 이미지 경로
+            settings: 처리 설정 지문
+            faces: 감지된 얼굴 수
+        """
+        stat = os.stat(source)
+        entry = {
+            "source": source,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "settings": settings,
+            "output": output,
+            "faces": int(faces),
+        }
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.entries[source] = entry
+
+        self._pending += 1
+        if self._pending >= self.FLUSH_INTERVAL:
+            self._file.flush()
+            self._pending = 0
+
+    def close(self) -> None:
+        """버퍼를 비우고 파일을 닫습니다."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._pending = 0
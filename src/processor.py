@@ -4,20 +4,73 @@
 이미지 폴더를 일괄 처리하고 통계를 수집합니다.
 """
 
+import hashlib
+import json
+import multiprocessing
+import os
+import queue
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import cv2
 import numpy as np
 from tqdm import tqdm
 
+from .cache import DetectionCache, detector_fingerprint, file_digest
 from .detector import FaceDetector, get_detector
 from .license import LicenseManager
+from .manifest import ProcessingManifest
 from .mosaic import process_faces
 from .utils import get_image_files, load_image, save_image, setup_logger
 from .watermark import add_logo, apply_free_watermark
 
 
+# 워커 프로세스 전역 상태 (프로세스당 1회 초기화)
+_worker_processor: Optional["FaceMosaicProcessor"] = None
+_worker_cancel_event = None
+
+
+def _init_worker(config: Dict, cancel_event) -> None:
+    """
+    워커 프로세스를 초기화합니다.
+    
+    워커마다 감지기를 한 번만 생성(get_detector)하여 이후 청크 처리에 재사용합니다.
+    
+    Args:
+        config: FaceMosaicProcessor 생성 인자
+        cancel_event: 부모 프로세스와 공유하는 취소 이벤트
+    """
+    global _worker_processor, _worker_cancel_event
+    _worker_processor = FaceMosaicProcessor(**config)
+    _worker_cancel_event = cancel_event
+
+
+def _process_chunk(tasks: List[Tuple[str, str]]) -> List[Dict]:
+    """
+    워커 프로세스에서 이미지 청크를 처리합니다.
+    
+    감지 배치마다 취소 이벤트를 확인하므로 취소 지연은 최대 1배치(기본 1장) 처리 시간입니다.
+    MemoryError / 디스크 공간 부족 OSError는 그대로 부모로 전파됩니다.
+    
+    Args:
+        tasks: (입력 경로, 출력 경로) 리스트
+    
+    Returns:
+        처리한 이미지별 결과 딕셔너리 리스트
+    """
+    results = []
+    batch_size = _worker_processor.detect_batch_size
+    for start in range(0, len(tasks), batch_size):
+        if _worker_cancel_event is not None and _worker_cancel_event.is_set():
+            break
+        results.extend(_worker_processor._process_batch(tasks[start:start + batch_size]))
+    _worker_processor._flush_detect_cache()
+    return results
+
+
 class FaceMosaicProcessor:
     """얼굴 모자이크 일괄 처리 클래스"""
     
@@ -32,7 +85,18 @@ class FaceMosaicProcessor:
         logo_path: Optional[str] = None,
         logo_scale: float = 0.2,  # 기본값 2배 증가 (0.1 → 0.2)
         logo_margin: int = 20,
-        logo_opacity: float = 1.0
+        logo_opacity: float = 1.0,
+        workers: int = 1,
+        chunk_size: int = 8,
+        pipeline: bool = False,
+        read_threads: int = 2,
+        detect_threads: int = 1,
+        write_threads: int = 2,
+        queue_depth: int = 8,
+        detect_batch_size: int = 1,
+        detect_cache: bool = True,
+        detect_cache_path: Optional[str] = None,
+        detect_cache_max_mb: float = 256.0
     ):
         """
         프로세서 초기화.
@@ -44,7 +108,30 @@ class FaceMosaicProcessor:
             mosaic_size: 모자이크 블록 크기
             blur_kernel_size: 블러 커널 크기
             quality: 저장 품질 (1-100)
+            workers: 일괄 처리 프로세스 수 (1이면 단일 프로세스 순차 처리)
+            chunk_size: 워커에 한 번에 전달할 이미지 수
+            pipeline: 디코드 → 감지/렌더링 → 인코드 단계를 스레드로 겹쳐 실행할지 여부
+                      (단일 프로세스 모드에서 사용)
+            read_threads: 파이프라인 디코드 단계 스레드 수
+            detect_threads: 파이프라인 감지/렌더링 단계 스레드 수
+            write_threads: 파이프라인 인코드 단계 스레드 수
+            queue_depth: 단계 사이 큐의 최대 이미지 수 (메모리 사용량 상한)
+            detect_batch_size: 감지기에 한 번에 전달할 이미지 수 (DNN 배치 추론)
+            detect_cache: 감지 결과 캐시 사용 여부 (파일 내용 + 감지기 설정 기준)
+            detect_cache_path: 감지 캐시 파일 경로 (None이면 ~/.face-mosaic-local/detect_cache.sqlite3)
+            detect_cache_max_mb: 감지 캐시 최대 크기 (MB)
         """
+        if workers < 1:
+            raise ValueError(f"워커 수는 1 이상이어야 합니다: {workers}")
+        if chunk_size < 1:
+            raise ValueError(f"청크 크기는 1 이상이어야 합니다: {chunk_size}")
+        if min(read_threads, detect_threads, write_threads) < 1:
+            raise ValueError("파이프라인 단계별 스레드 수는 1 이상이어야 합니다.")
+        if queue_depth < 1:
+            raise ValueError(f"큐 깊이는 1 이상이어야 합니다: {queue_depth}")
+        if detect_batch_size < 1:
+            raise ValueError(f"감지 배치 크기는 1 이상이어야 합니다: {detect_batch_size}")
+
         # 감지기 초기화
         detector_kwargs = detector_kwargs or {}
         self.detector: FaceDetector = get_detector(detector_type, **detector_kwargs)
@@ -61,18 +148,62 @@ class FaceMosaicProcessor:
         self.logo_margin = logo_margin
         self.logo_opacity = logo_opacity
         
+        # 병렬 처리 설정
+        self.workers = workers
+        self.chunk_size = chunk_size
+        
+        # 파이프라인 설정
+        self.pipeline = pipeline
+        self.read_threads = read_threads
+        self.detect_threads = detect_threads
+        self.write_threads = write_threads
+        self.queue_depth = queue_depth
+        self.detect_batch_size = detect_batch_size
+        
+        # 워커 프로세스에서 동일한 프로세서를 재구성하기 위한 설정
+        self._worker_config = {
+            "detector_type": detector_type,
+            "detector_kwargs": dict(detector_kwargs),
+            "method": method,
+            "mosaic_size": mosaic_size,
+            "blur_kernel_size": blur_kernel_size,
+            "quality": quality,
+            "logo_path": logo_path,
+            "logo_scale": logo_scale,
+            "logo_margin": logo_margin,
+            "logo_opacity": logo_opacity,
+            "detect_batch_size": detect_batch_size,
+            "detect_cache": detect_cache,
+            "detect_cache_path": detect_cache_path,
+            "detect_cache_max_mb": detect_cache_max_mb,
+        }
+        
         # 로거 설정
         self.logger = setup_logger("face_mosaic_processor")
+        
+        # 감지 결과 캐시 (열기에 실패하면 캐시 없이 진행)
+        self.detect_cache: Optional[DetectionCache] = None
+        if detect_cache:
+            try:
+                self.detect_cache = DetectionCache(detect_cache_path, max_size_mb=detect_cache_max_mb)
+            except Exception as e:
+                self.logger.warning(f"감지 캐시를 열 수 없어 캐시 없이 진행합니다: {e}")
 
         # 라이선스 관리 (1회 생성, process_image/process_folder에서 재사용)
         self._license_mgr = LicenseManager()
         
+        # 처리 매니페스트 (process_folder 실행 중에만 사용)
+        self._manifest: Optional[ProcessingManifest] = None
+        self._settings_fingerprint = ""
+        self._start_time = 0.0
+        
         # 통계
         self.stats = {
             "total": 0,
             "success": 0,
             "failed": 0,
             "skipped": 0,
+            "up_to_date": 0,
             "faces_detected": 0,
             "processing_time": 0.0
         }
@@ -92,157 +223,709 @@ class FaceMosaicProcessor:
         Returns:
             (성공 여부, 감지된 얼굴 수) 튜플
         """
-        try:
-            # 이미지 로드
-            image, exif_data = load_image(input_path)
-            
-            # 얼굴 감지
-            faces = self.detector.detect(image)
-            
-            # 얼굴이 감지된 경우에만 처리
-            if faces:
-                # 모자이크/블러 적용
-                if self.method == "mosaic":
-                    image = process_faces(image, faces, method="mosaic", block_size=self.mosaic_size)
-                else:
-                    image = process_faces(image, faces, method="blur", kernel_size=self.blur_kernel_size)
-            
-            # 로고 추가 (지정된 경우)
-            if self.logo_path:
+        result = self._process_batch([(input_path, output_path)])[0]
+        return result["success"], result["face_count"]
+    
+    def _load_stage(self, input_path: str) -> Tuple[np.ndarray, Optional[bytes]]:
+        """디코드 단계: 이미지를 읽어 BGR 배열과 EXIF bytes를 반환합니다."""
+        return load_image(input_path)
+    
+    def _detect_stage(
+        self,
+        images: List[np.ndarray],
+        detector: FaceDetector,
+        input_files: List[str]
+    ) -> List:
+        """
+        감지 단계: 여러 이미지의 얼굴을 감지합니다.
+        
+        감지 캐시에 결과가 있는 이미지는 감지를 생략하고, 나머지만 감지한 뒤 캐시에 저장합니다.
+        
+        Returns:
+            이미지별 얼굴 바운딩 박스 리스트 또는 감지 중 발생한 예외
+        """
+        keys: List[Optional[str]] = [None] * len(images)
+        results: List = [None] * len(images)
+        
+        if self.detect_cache is not None:
+            fingerprint = detector_fingerprint(detector.name, detector.get_params())
+            for index, input_file in enumerate(input_files):
                 try:
-                    image = add_logo(
-                        image,
-                        self.logo_path,
-                        position="bottom-right",
-                        scale=self.logo_scale,
-                        margin=self.logo_margin,
-                        opacity=self.logo_opacity
-                    )
+                    keys[index] = DetectionCache.make_key(file_digest(input_file), fingerprint)
+                    results[index] = self.detect_cache.get(keys[index])
                 except Exception as e:
-                    self.logger.warning(f"로고 추가 실패: {e}")
-
-            # 무료 버전 워터마크 (라이선스에 따라)
-            if self._license_mgr.watermark_enabled:
-                image = apply_free_watermark(image)
+                    self.logger.warning(f"감지 캐시 조회 실패: {input_file} - {e}")
+        
+        misses = [index for index, faces in enumerate(results) if faces is None]
+        if misses:
+            detected = self._detect_uncached([images[index] for index in misses], detector)
+            for index, faces in zip(misses, detected):
+                results[index] = faces
+                if keys[index] is not None and not isinstance(faces, Exception):
+                    try:
+                        self.detect_cache.put(keys[index], faces)
+                    except Exception as e:
+                        self.logger.warning(f"감지 캐시 저장 실패: {input_files[index]} - {e}")
+        
+        return results
+    
+    def _detect_uncached(self, images: List[np.ndarray], detector: FaceDetector) -> List:
+        """
+        감지기로 여러 이미지의 얼굴을 감지합니다.
+        
+        2장 이상이면 detect_batch로 한 번에 추론하고, 배치 감지가 실패하면
+        이미지별 detect로 전환하여 오류를 해당 이미지로 한정합니다.
+        """
+        if len(images) > 1:
+            try:
+                return detector.detect_batch(images)
+            except Exception as e:
+                self.logger.warning(f"배치 감지 실패, 이미지별 감지로 전환합니다: {e}")
+        
+        results = []
+        for image in images:
+            try:
+                results.append(detector.detect(image))
+            except Exception as e:
+                results.append(e)
+        return results
+    
+    def _render_stage(self, image: np.ndarray, faces: List[Tuple[int, int, int, int]]) -> np.ndarray:
+        """렌더링 단계: 감지된 얼굴에 모자이크/블러를 적용하고 로고, 워터마크를 추가합니다."""
+        # 얼굴이 감지된 경우에만 처리
+        if faces:
+            # 모자이크/블러 적용
+            if self.method == "mosaic":
+                image = process_faces(image, faces, method="mosaic", block_size=self.mosaic_size)
+            else:
+                image = process_faces(image, faces, method="blur", kernel_size=self.blur_kernel_size)
+        
+        # 로고 추가 (지정된 경우)
+        if self.logo_path:
+            try:
+                image = add_logo(
+                    image,
+                    self.logo_path,
+                    position="bottom-right",
+                    scale=self.logo_scale,
+                    margin=self.logo_margin,
+                    opacity=self.logo_opacity
+                )
+            except Exception as e:
+                self.logger.warning(f"로고 추가 실패: {e}")
 
-            # 이미지 저장
-            save_image(image, output_path, quality=self.quality, exif_data=exif_data)
-            
-            return True, len(faces)
+        # 무료 버전 워터마크 (라이선스에 따라)
+        if self._license_mgr.watermark_enabled:
+            image = apply_free_watermark(image)
+        
+        return image
+    
+    def _save_stage(self, image: np.ndarray, output_path: str, exif_data: Optional[bytes]) -> None:
+        """인코드 단계: 이미지를 인코딩하여 저장합니다."""
+        save_image(image, output_path, quality=self.quality, exif_data=exif_data)
+    
+    def _handle_error(self, input_path: str, error: Exception) -> Tuple[bool, int]:
+        """
+        이미지 처리 중 발생한 예외를 분류합니다.
         
-        except MemoryError:
+        메모리 부족과 디스크 공간 부족은 다시 발생시켜 일괄 처리를 중단하고,
+        그 외 오류는 로그만 남기고 실패로 처리합니다.
+        """
+        if isinstance(error, MemoryError):
             self.logger.critical(f"메모리 부족: {input_path}")
-            raise  # 상위로 전파하여 일괄 처리 중단
+            raise error  # 상위로 전파하여 일괄 처리 중단
 
-        except OSError as e:
+        if isinstance(error, OSError):
             # 디스크 공간 부족 등 치명적 I/O 에러는 상위로 전파
-            if e.errno == 28 or "No space left" in str(e):
-                self.logger.critical(f"디스크 공간 부족: {e}")
-                raise
-            self.logger.error(f"파일 I/O 오류: {input_path} - {e}")
+            if error.errno == 28 or "No space left" in str(error):
+                self.logger.critical(f"디스크 공간 부족: {error}")
+                raise error
+            self.logger.error(f"파일 I/O 오류: {input_path} - {error}")
             return False, 0
 
-        except Exception as e:
-            self.logger.error(f"이미지 처리 실패: {input_path} - {e}")
-            return False, 0
+        self.logger.error(f"이미지 처리 실패: {input_path} - {error}")
+        return False, 0
     
-    def process_folder(
+    def iter_process(
         self,
         input_dir: str,
         output_dir: str,
         recursive: bool = False,
+        incremental: bool = False,
         cancel_check: Optional[Callable[[], bool]] = None
+    ) -> Iterator[Dict]:
+        """
+        폴더 내 이미지를 처리하면서 이미지별 결과를 완료되는 즉시 반환합니다.
+        
+        결과를 모아 두지 않으므로 폴더 크기와 관계없이 메모리 사용량이 일정하며,
+        호출자가 반복을 중단하면(break, close) 남은 처리도 취소됩니다.
+        통계(self.stats)와 매니페스트는 반복하는 동안 갱신됩니다.
+        
+        Args:
+            input_dir: 입력 폴더 경로
+            output_dir: 출력 폴더 경로
+            recursive: 하위 폴더까지 재귀적으로 처리할지 여부
+            incremental: 매니페스트 기준으로 현재 설정의 출력이 최신인 이미지는 건너뜀
+            cancel_check: True를 반환하면 처리를 취소하는 콜백
+        
+        Yields:
+            이미지별 결과 딕셔너리
+            (input_path, output_path, success, face_count, boxes, timings)
+        """
+        tasks = self._prepare_tasks(input_dir, output_dir, recursive, incremental)
+        if not tasks:
+            return
+        
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        self.logger.info(f"처리 시작: {self.stats['total']}개 이미지")
+        
+        yield from self._iter_tasks(tasks, cancel_check)
+    
+    def process_folder(
+        self,
+        input_dir: str,
+        output_dir: str,
+        recursive: bool = False,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        incremental: bool = False
     ) -> Dict:
         """
         폴더 내 모든 이미지를 일괄 처리합니다.
         
+        처리가 끝난 이미지는 출력 폴더의 매니페스트에 기록됩니다.
+        
         Args:
             input_dir: 입력 폴더 경로
             output_dir: 출력 폴더 경로
             recursive: 하위 폴더까지 재귀적으로 처리할지 여부
+            cancel_check: True를 반환하면 처리를 취소하는 콜백
+            incremental: 매니페스트 기준으로 현재 설정의 출력이 최신인 이미지는 건너뜀
+                         (중단된 작업 이어서 처리)
         
         Returns:
             처리 통계 딕셔너리
         """
+        tasks = self._prepare_tasks(input_dir, output_dir, recursive, incremental)
+        if not tasks:
+            return self.stats
+        
+        # 출력 폴더 생성
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        
+        self.logger.info(f"처리 시작: {self.stats['total']}개 이미지")
+        
+        # 진행률 표시와 함께 처리
+        try:
+            with tqdm(total=len(tasks), desc="처리 중", unit="장") as progress:
+                for _ in self._iter_tasks(tasks, cancel_check):
+                    progress.update(1)
+
+        except (MemoryError, OSError, BrokenProcessPool) as e:
+            self.logger.critical(f"치명적 오류로 처리 중단: {e}")
+            self.stats["failed"] += 1
+        
+        # 결과 리포트 출력
+        self._print_report()
+        
+        return self.stats
+    
+    def _prepare_tasks(
+        self,
+        input_dir: str,
+        output_dir: str,
+        recursive: bool,
+        incremental: bool
+    ) -> List[Tuple[str, str]]:
+        """
+        통계를 초기화하고 처리할 (입력, 출력) 작업 목록을 만듭니다.
+        
+        incremental이면 매니페스트 기준으로 최신인 이미지를 제외하고,
+        무료 버전이면 배치 제한을 적용합니다.
+        """
         # 통계 초기화
         self.stats = {
             "total": 0,
             "success": 0,
             "failed": 0,
             "skipped": 0,
+            "up_to_date": 0,
             "faces_detected": 0,
             "processing_time": 0.0
         }
         
-        start_time = time.time()
+        self._start_time = time.time()
         
         # 이미지 파일 목록 가져오기
         try:
             image_files = get_image_files(input_dir, recursive=recursive)
         except Exception as e:
             self.logger.error(f"이미지 파일 목록 가져오기 실패: {e}")
-            return self.stats
+            return []
+
+        output_path = Path(output_dir)
+        
+        # (입력, 출력) 작업 목록 구성 (재귀 처리 시 상대 경로 유지)
+        tasks = [
+            (str(image_file), str(self._output_file(image_file, input_dir, output_path, recursive)))
+            for image_file in image_files
+        ]
+        
+        # 매니페스트 로드 및 최신 출력 건너뛰기
+        self._manifest = ProcessingManifest(output_dir)
+        self._settings_fingerprint = self._compute_settings_fingerprint()
+        if incremental:
+            self._manifest.load()
+            pending_tasks = [
+                task for task in tasks
+                if not self._manifest.is_up_to_date(task[0], task[1], self._settings_fingerprint)
+            ]
+            self.stats["up_to_date"] = len(tasks) - len(pending_tasks)
+            if self.stats["up_to_date"]:
+                self.logger.info(f"이미 처리된 최신 이미지 {self.stats['up_to_date']}개를 건너뜁니다.")
+            tasks = pending_tasks
 
-        if self._license_mgr.batch_limit > 0 and len(image_files) > self._license_mgr.batch_limit:
+        if self._license_mgr.batch_limit > 0 and len(tasks) > self._license_mgr.batch_limit:
             self.logger.warning(
                 f"무료 버전은 한 번에 {self._license_mgr.batch_limit}장까지 처리 가능합니다. "
-                f"(총 {len(image_files)}장 중 {self._license_mgr.batch_limit}장만 처리)"
+                f"(총 {len(tasks)}장 중 {self._license_mgr.batch_limit}장만 처리)"
             )
-            image_files = image_files[:self._license_mgr.batch_limit]
+            tasks = tasks[:self._license_mgr.batch_limit]
         
-        self.stats["total"] = len(image_files)
+        self.stats["total"] = len(tasks)
         
         if self.stats["total"] == 0:
             self.logger.warning(f"처리할 이미지가 없습니다: {input_dir}")
-            return self.stats
+            self._manifest = None
         
-        # 출력 폴더 생성
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        return tasks
+    
+    def _iter_tasks(
+        self,
+        tasks: List[Tuple[str, str]],
+        cancel_check: Optional[Callable[[], bool]]
+    ) -> Iterator[Dict]:
+        """
+        실행 모드(프로세스 풀 / 파이프라인 / 순차)에 맞게 작업을 처리하며 결과를 반환합니다.
         
-        self.logger.info(f"처리 시작: {self.stats['total']}개 이미지")
+        결과마다 통계와 매니페스트를 갱신하고, 종료 시 매니페스트와 감지 캐시를 정리합니다.
+        """
+        if self.workers > 1:
+            runner = self._iter_parallel(tasks, cancel_check)
+        elif self.pipeline:
+            runner = self._iter_pipelined(tasks, cancel_check)
+        else:
+            runner = self._iter_serial(tasks, cancel_check)
         
-        # 진행률 표시와 함께 처리
         try:
-            for image_file in tqdm(image_files, desc="처리 중", unit="장"):
-                # 취소 체크
-                if cancel_check and cancel_check():
-                    self.logger.info("사용자에 의해 처리가 취소되었습니다.")
-                    break
-
-                # 상대 경로 유지 (재귀 처리 시)
-                if recursive:
-                    relative_path = image_file.relative_to(Path(input_dir))
-                    output_file = output_path / relative_path
-                else:
-                    output_file = output_path / image_file.name
-
-                # 출력 디렉토리 생성
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-
-                # 이미지 처리
-                success, face_count = self.process_image(str(image_file), str(output_file))
-
-                if success:
-                    self.stats["success"] += 1
-                    self.stats["faces_detected"] += face_count
-
-                    if face_count == 0:
-                        self.stats["skipped"] += 1
-                else:
-                    self.stats["failed"] += 1
+            for result in runner:
+                self._record_result(result)
+                yield result
+        finally:
+            runner.close()
+            if self._manifest is not None:
+                self._manifest.close()
+                self._manifest = None
+            self._flush_detect_cache()
+            
+            # 처리 시간 계산
+            self.stats["processing_time"] = time.time() - self._start_time
+    
+    @staticmethod
+    def _output_file(image_file: Path, input_dir: str, output_path: Path, recursive: bool) -> Path:
+        """입력 파일에 대응하는 출력 파일 경로를 계산합니다."""
+        if recursive:
+            return output_path / image_file.relative_to(Path(input_dir))
+        return output_path / image_file.name
+    
+    @staticmethod
+    def _make_result(
+        input_file: str,
+        output_file: str,
+        success: bool,
+        boxes: List[Tuple[int, int, int, int]],
+        timings: Dict[str, float]
+    ) -> Dict:
+        """이미지 1장의 처리 결과 딕셔너리를 만듭니다."""
+        return {
+            "input_path": input_file,
+            "output_path": output_file,
+            "success": success,
+            "face_count": len(boxes),
+            "boxes": [tuple(int(v) for v in box) for box in boxes],
+            "timings": timings,
+        }
+    
+    def _failed_result(self, input_file: str, output_file: str, error: Exception, timings: Dict[str, float]) -> Dict:
+        """예외를 분류한 뒤 실패 결과를 만듭니다 (치명적 오류는 다시 발생)."""
+        self._handle_error(input_file, error)
+        return self._make_result(input_file, output_file, False, [], timings)
+    
+    def _process_batch(self, tasks: List[Tuple[str, str]]) -> List[Dict]:
+        """
+        이미지 묶음을 처리합니다 (디코드 → 배치 감지 → 렌더링/저장).
+        
+        Args:
+            tasks: (입력 경로, 출력 경로) 리스트
+        
+        Returns:
+            작업별 결과 딕셔너리 리스트 (입력 순서와 동일)
+        """
+        results: List[Optional[Dict]] = [None] * len(tasks)
+        timings: List[Dict[str, float]] = [{} for _ in tasks]
+        
+        # 디코드
+        loaded = []
+        for index, (input_file, output_file) in enumerate(tasks):
+            start = time.perf_counter()
+            try:
+                Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+                image, exif_data = self._load_stage(input_file)
+            except Exception as e:
+                results[index] = self._failed_result(input_file, output_file, e, timings[index])
+                continue
+            timings[index]["load"] = time.perf_counter() - start
+            loaded.append((index, image, exif_data))
+        
+        # 배치 감지 (배치 시간은 이미지 수로 나누어 기록)
+        start = time.perf_counter()
+        detected = self._detect_stage(
+            [image for _, image, _ in loaded],
+            self.detector,
+            [tasks[index][0] for index, _, _ in loaded]
+        )
+        detect_time = (time.perf_counter() - start) / max(1, len(loaded))
+        
+        # 렌더링 및 저장
+        for (index, image, exif_data), faces in zip(loaded, detected):
+            input_file, output_file = tasks[index]
+            timings[index]["detect"] = detect_time
+            try:
+                if isinstance(faces, Exception):
+                    raise faces
+                start = time.perf_counter()
+                image = self._render_stage(image, faces)
+                timings[index]["render"] = time.perf_counter() - start
+                
+                start = time.perf_counter()
+                self._save_stage(image, output_file, exif_data)
+                timings[index]["save"] = time.perf_counter() - start
+                
+                results[index] = self._make_result(input_file, output_file, True, faces, timings[index])
+            except Exception as e:
+                results[index] = self._failed_result(input_file, output_file, e, timings[index])
+        
+        return results
+    
+    def _flush_detect_cache(self) -> None:
+        """감지 캐시의 대기 중인 변경 사항을 디스크에 기록합니다."""
+        if self.detect_cache is None:
+            return
+        try:
+            self.detect_cache.flush()
+        except Exception as e:
+            self.logger.warning(f"감지 캐시 기록 실패: {e}")
+    
+    def _compute_settings_fingerprint(self) -> str:
+        """출력에 영향을 주는 처리 설정의 지문을 계산합니다 (매니페스트 최신 여부 판단용)."""
+        settings = {
+            "detector": self.detector.name,
+            "detector_params": self.detector.get_params(),
+            "method": self.method,
+            "mosaic_size": self.mosaic_size,
+            "blur_kernel_size": self.blur_kernel_size,
+            "quality": self.quality,
+            "logo_path": self.logo_path,
+            "logo_scale": self.logo_scale,
+            "logo_margin": self.logo_margin,
+            "logo_opacity": self.logo_opacity,
+            "watermark": self._license_mgr.watermark_enabled,
+        }
+        # 같은 경로의 로고 파일이 바뀐 경우도 구분
+        if self.logo_path and os.path.exists(self.logo_path):
+            logo_stat = os.stat(self.logo_path)
+            settings["logo_file"] = [logo_stat.st_size, logo_stat.st_mtime_ns]
+        payload = json.dumps(settings, sort_keys=True, default=list)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+    
+    def _record_result(self, result: Dict) -> None:
+        """이미지 1장의 처리 결과를 통계와 매니페스트에 반영합니다."""
+        success = result["success"]
+        face_count = result["face_count"]
+        
+        if success and self._manifest is not None:
+            try:
+                self._manifest.record(
+                    result["input_path"], result["output_path"], self._settings_fingerprint, face_count
+                )
+            except OSError as e:
+                self.logger.warning(f"매니페스트 기록 실패: {result['input_path']} - {e}")
+        
+        if success:
+            self.stats["success"] += 1
+            self.stats["faces_detected"] += face_count
 
-        except (MemoryError, OSError) as e:
-            self.logger.critical(f"치명적 오류로 처리 중단: {e}")
+            if face_count == 0:
+                self.stats["skipped"] += 1
+        else:
             self.stats["failed"] += 1
+    
+    def _iter_serial(
+        self,
+        tasks: List[Tuple[str, str]],
+        cancel_check: Optional[Callable[[], bool]]
+    ) -> Iterator[Dict]:
+        """현재 프로세스에서 작업을 감지 배치 단위로 순차 처리합니다."""
+        for start in range(0, len(tasks), self.detect_batch_size):
+            # 취소 체크
+            if cancel_check and cancel_check():
+                self.logger.info("사용자에 의해 처리가 취소되었습니다.")
+                break
 
-        # 처리 시간 계산
-        self.stats["processing_time"] = time.time() - start_time
+            yield from self._process_batch(tasks[start:start + self.detect_batch_size])
+    
+    def _iter_parallel(
+        self,
+        tasks: List[Tuple[str, str]],
+        cancel_check: Optional[Callable[[], bool]]
+    ) -> Iterator[Dict]:
+        """
+        프로세스 풀에서 작업을 청크 단위로 병렬 처리합니다.
         
-        # 결과 리포트 출력
-        self._print_report()
+        동시에 제출하는 청크 수를 워커 수의 2배로 제한하여 대기 중인 결과가 쌓이지 않게 하고,
+        cancel_check가 True가 되거나 호출자가 반복을 중단하면 공유 이벤트로 워커에 취소를 알립니다.
+        워커에서 발생한 MemoryError / OSError는 그대로 전파되어 일괄 처리를 중단합니다.
+        """
+        ctx = multiprocessing.get_context()
+        cancel_event = ctx.Event()
+        chunks = (tasks[i:i + self.chunk_size] for i in range(0, len(tasks), self.chunk_size))
+        max_in_flight = self.workers * 2
         
-        return self.stats
+        self.logger.info(f"병렬 처리: 워커 {self.workers}개, 청크 크기 {self.chunk_size}")
+        
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self._worker_config, cancel_event)
+        ) as executor:
+            in_flight = set()
+            
+            def submit_next() -> None:
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    in_flight.add(executor.submit(_process_chunk, chunk))
+            
+            for _ in range(max_in_flight):
+                submit_next()
+            
+            try:
+                while in_flight:
+                    done, _ = wait(in_flight, timeout=0.1, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        in_flight.discard(future)
+                        if future.cancelled():
+                            continue
+                        chunk_results = future.result()
+                        if not cancel_event.is_set():
+                            submit_next()
+                        yield from chunk_results
+                    
+                    # 취소 체크
+                    if cancel_check and not cancel_event.is_set() and cancel_check():
+                        self.logger.info("사용자에 의해 처리가 취소되었습니다.")
+                        cancel_event.set()
+                        for future in in_flight:
+                            future.cancel()
+            finally:
+                # 치명적 오류나 반복 중단 시 남은 작업을 취소하고 실행 중인 워커를 멈춤
+                cancel_event.set()
+                for future in in_flight:
+                    future.cancel()
+    
+    def _iter_pipelined(
+        self,
+        tasks: List[Tuple[str, str]],
+        cancel_check: Optional[Callable[[], bool]]
+    ) -> Iterator[Dict]:
+        """
+        디코드 → 감지/렌더링 → 인코드 단계를 스레드 파이프라인으로 처리합니다.
+        
+        단계 사이는 크기가 제한된 큐로 연결되어 디스크 I/O와 연산이 겹쳐 실행되며,
+        메모리에 올라가는 이미지 수는 queue_depth로 제한됩니다.
+        감지 스레드가 여러 개이면 스레드마다 별도의 감지기를 사용합니다.
+        """
+        task_queue: queue.Queue = queue.Queue()
+        decoded: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+        rendered: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+        results: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+        stop = threading.Event()
+        fatal_errors: List[BaseException] = []
+        
+        for task in tasks:
+            task_queue.put(task)
+        
+        self.logger.info(
+            f"파이프라인 처리: 디코드 {self.read_threads}, 감지/렌더링 {self.detect_threads}, "
+            f"인코드 {self.write_threads} 스레드, 큐 깊이 {self.queue_depth}"
+        )
+        
+        def put(target: queue.Queue, item) -> bool:
+            # 중단 요청을 확인하면서 다음 단계 큐에 넣기 (큐가 가득 차면 대기)
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def get(source: queue.Queue):
+            # 중단 요청을 확인하면서 이전 단계 큐에서 꺼내기
+            while not stop.is_set():
+                try:
+                    return source.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            return None
+        
+        def stage(body: Callable[[], None], remaining: List[int], lock: threading.Lock,
+                  downstream: Optional[queue.Queue], downstream_count: int) -> Callable[[], None]:
+            # 단계 스레드 본체: 치명적 오류를 기록하고, 단계의 마지막 스레드가 종료 신호를 전달
+            def run() -> None:
+                try:
+                    body()
+                except BaseException as e:
+                    fatal_errors.append(e)
+                    stop.set()
+                finally:
+                    with lock:
+                        remaining[0] -= 1
+                        last = remaining[0] == 0
+                    if last and downstream is not None:
+                        for _ in range(downstream_count):
+                            put(downstream, None)
+            return run
+        
+        def read() -> None:
+            while not stop.is_set():
+                try:
+                    input_file, output_file = task_queue.get_nowait()
+                except queue.Empty:
+                    return
+                timings: Dict[str, float] = {}
+                start = time.perf_counter()
+                try:
+                    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+                    image, exif_data = self._load_stage(input_file)
+                except Exception as e:
+                    put(results, self._failed_result(input_file, output_file, e, timings))
+                    continue
+                timings["load"] = time.perf_counter() - start
+                if not put(decoded, (input_file, output_file, image, exif_data, timings)):
+                    return
+        
+        def detect_and_render(detector: FaceDetector) -> Callable[[], None]:
+            def run() -> None:
+                finished = False
+                while not finished:
+                    item = get(decoded)
+                    if item is None:
+                        return
+                    
+                    # 대기 중인 이미지를 감지 배치 크기까지 모으기
+                    batch = [item]
+                    while len(batch) < self.detect_batch_size:
+                        try:
+                            item = decoded.get_nowait()
+                        except queue.Empty:
+                            break
+                        if item is None:
+                            finished = True
+                            break
+                        batch.append(item)
+                    
+                    start = time.perf_counter()
+                    detected = self._detect_stage(
+                        [image for _, _, image, _, _ in batch],
+                        detector,
+                        [input_file for input_file, _, _, _, _ in batch]
+                    )
+                    detect_time = (time.perf_counter() - start) / len(batch)
+                    
+                    for (input_file, output_file, image, exif_data, timings), faces in zip(batch, detected):
+                        timings["detect"] = detect_time
+                        try:
+                            if isinstance(faces, Exception):
+                                raise faces
+                            start = time.perf_counter()
+                            image = self._render_stage(image, faces)
+                            timings["render"] = time.perf_counter() - start
+                        except Exception as e:
+                            put(results, self._failed_result(input_file, output_file, e, timings))
+                            continue
+                        if not put(rendered, (input_file, output_file, image, exif_data, faces, timings)):
+                            return
+            return run
+        
+        def write() -> None:
+            while True:
+                item = get(rendered)
+                if item is None:
+                    return
+                input_file, output_file, image, exif_data, faces, timings = item
+                start = time.perf_counter()
+                try:
+                    self._save_stage(image, output_file, exif_data)
+                except Exception as e:
+                    put(results, self._failed_result(input_file, output_file, e, timings))
+                    continue
+                timings["save"] = time.perf_counter() - start
+                put(results, self._make_result(input_file, output_file, True, faces, timings))
+        
+        # 감지 스레드별 감지기 (첫 번째는 기존 감지기 재사용)
+        detectors = [self.detector] + [
+            get_detector(self._worker_config["detector_type"], **self._worker_config["detector_kwargs"])
+            for _ in range(self.detect_threads - 1)
+        ]
+        
+        read_lock, detect_lock, write_lock = threading.Lock(), threading.Lock(), threading.Lock()
+        read_remaining, detect_remaining, write_remaining = (
+            [self.read_threads], [self.detect_threads], [self.write_threads]
+        )
+        threads = (
+            [threading.Thread(target=stage(read, read_remaining, read_lock, decoded, self.detect_threads))
+             for _ in range(self.read_threads)]
+            + [threading.Thread(target=stage(detect_and_render(detector), detect_remaining, detect_lock,
+                                             rendered, self.write_threads))
+               for detector in detectors]
+            + [threading.Thread(target=stage(write, write_remaining, write_lock, None, 0))
+               for _ in range(self.write_threads)]
+        )
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        
+        try:
+            while any(thread.is_alive() for thread in threads) or not results.empty():
+                try:
+                    result = results.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+                else:
+                    yield result
+                
+                # 취소 체크
+                if cancel_check and not stop.is_set() and cancel_check():
+                    self.logger.info("사용자에 의해 처리가 취소되었습니다.")
+                    stop.set()
+        finally:
+            # 반복 중단 시 모든 단계를 멈추고 스레드 종료 대기
+            stop.set()
+            for thread in threads:
+                thread.join()
+        
+        if fatal_errors:
+            raise fatal_errors[0]
     
     def _print_report(self) -> None:
         """처리 결과 리포트를 출력합니다."""
@@ -255,6 +938,8 @@ class FaceMosaicProcessor:
         self.logger.info(f"성공: {stats['success']}장")
         self.logger.info(f"실패: {stats['failed']}장")
         self.logger.info(f"스킵 (얼굴 없음): {stats['skipped']}장")
+        if stats.get("up_to_date"):
+            self.logger.info(f"이미 최신 (건너뜀): {stats['up_to_date']}장")
         self.logger.info(f"감지된 얼굴: {stats['faces_detected']}개")
         self.logger.info(f"처리 시간: {stats['processing_time']:.2f}초")
         
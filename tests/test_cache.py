@@ -0,0 +1,83 @@
+"""
+감지 결과 캐시 모듈 테스트
+"""
+
+import numpy as np
+import pytest
+
+from src.cache import DetectionCache, detector_fingerprint, file_digest
+from src.processor import FaceMosaicProcessor
+
+
+class TestDetectionCache:
+    """DetectionCache 테스트"""
+
+    def test_put_get_roundtrip(self, tmp_path):
+        """저장한 감지 결과를 그대로 조회"""
+        cache = DetectionCache(str(tmp_path / "cache.sqlite3"))
+        cache.put("k1", [(1, 2, 3, 4), (5, 6, 7, 8)])
+        assert cache.get("k1") == [(1, 2, 3, 4), (5, 6, 7, 8)]
+        assert cache.get("missing") is None
+        cache.close()
+
+    def test_persisted_after_close(self, tmp_path):
+        """닫은 뒤 다시 열어도 결과 유지"""
+        path = str(tmp_path / "cache.sqlite3")
+        cache = DetectionCache(path)
+        cache.put("k1", [])
+        cache.close()
+
+        reopened = DetectionCache(path)
+        assert reopened.get("k1") == []
+        reopened.close()
+
+    def test_size_based_eviction(self, tmp_path):
+        """최대 크기를 넘으면 오래 사용하지 않은 항목부터 제거"""
+        cache = DetectionCache(str(tmp_path / "cache.sqlite3"), max_size_mb=0.001)
+        for i in range(50):
+            cache.put(f"key-{i:03d}", [(i, i, 10, 10)] * 5)
+        cache.flush()
+
+        assert cache.total_size() <= cache.max_size_bytes
+        assert cache.get("key-049") == [(49, 49, 10, 10)] * 5
+        assert cache.get("key-000") is None
+        cache.close()
+
+    def test_key_depends_on_detector_params(self, tmp_path):
+        """감지기 파라미터가 다르면 키도 다름"""
+        path = tmp_path / "a.jpg"
+        path.write_bytes(b"abc")
+        digest = file_digest(str(path))
+        key1 = DetectionCache.make_key(digest, detector_fingerprint("dnn", {"confidence_threshold": 0.5}))
+        key2 = DetectionCache.make_key(digest, detector_fingerprint("dnn", {"confidence_threshold": 0.7}))
+        assert key1 != key2
+
+
+class TestProcessorDetectionCache:
+    """프로세서의 감지 캐시 사용 테스트"""
+
+    def test_second_run_skips_detection(self, tmp_path):
+        """두 번째 실행에서는 감지기를 호출하지 않음"""
+        import cv2
+
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        cv2.imwrite(str(input_dir / "a.png"), np.full((60, 80, 3), 100, dtype=np.uint8))
+        cache_path = str(tmp_path / "cache.sqlite3")
+
+        first = FaceMosaicProcessor(detector_type="haar", detect_cache_path=cache_path)
+        first.process_folder(str(input_dir), str(tmp_path / "out1"))
+
+        second = FaceMosaicProcessor(detector_type="haar", detect_cache_path=cache_path, method="blur")
+
+        def fail_detect(image):
+            pytest.fail("캐시된 이미지에 대해 감지기가 호출되었습니다.")
+
+        second.detector.detect = fail_detect
+        stats = second.process_folder(str(input_dir), str(tmp_path / "out2"))
+        assert stats["success"] == 1
+
+    def test_cache_disabled(self, tmp_path):
+        """detect_cache=False이면 캐시를 만들지 않음"""
+        processor = FaceMosaicProcessor(detector_type="haar", detect_cache=False)
+        assert processor.detect_cache is None
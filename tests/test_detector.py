@@ -34,6 +34,16 @@ class TestHaarCascadeDetector:
         image = np.ones((200, 200, 3), dtype=np.uint8) * 128
         faces = detector.detect(image)
         assert isinstance(faces, list)
+    
+    def test_detect_batch_matches_detect(self):
+        """배치 감지 결과가 이미지별 감지와 같은지 테스트"""
+        detector = HaarCascadeDetector()
+        images = [
+            np.zeros((100, 100, 3), dtype=np.uint8),
+            np.ones((120, 160, 3), dtype=np.uint8) * 128,
+        ]
+        results = detector.detect_batch(images)
+        assert results == [detector.detect(image) for image in images]
 
 
 class TestDNNDetector:
@@ -82,6 +92,24 @@ class TestDNNDetector:
         # 높은 임계값으로 감지기 생성
         detector = DNNDetector(confidence_threshold=0.99)
         assert detector.confidence_threshold == 0.99
+    
+    def test_detect_batch(self):
+        """배치 감지 테스트 (크기가 다른 이미지)"""
+        model_dir = Path(__file__).parent.parent / "models"
+        prototxt = model_dir / "deploy.prototxt"
+        model = model_dir / "res10_300x300_ssd_iter_140000.caffemodel"
+        
+        if not (prototxt.exists() and model.exists()):
+            pytest.skip("DNN 모델 파일이 없습니다.")
+        
+        detector = DNNDetector()
+        images = [
+            np.zeros((100, 100, 3), dtype=np.uint8),
+            np.zeros((240, 320, 3), dtype=np.uint8),
+        ]
+        results = detector.detect_batch(images)
+        assert len(results) == 2
+        assert results == [detector.detect(image) for image in images]
 
 
 class TestDetectorFactory:
@@ -74,3 +74,172 @@ class TestFaceMosaicProcessor:
         assert processor.stats["success"] == 0
         assert processor.stats["failed"] == 0
         assert processor.stats["faces_detected"] == 0
+    
+    def test_init_invalid_workers(self):
+        """잘못된 워커 수 테스트"""
+        with pytest.raises(ValueError):
+            FaceMosaicProcessor(detector_type="haar", workers=0)
+    
+    def test_process_folder_parallel_matches_serial(self, tmp_path):
+        """병렬 처리 결과가 순차 처리와 바이트 단위로 동일한지 테스트"""
+        import cv2
+        
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        rng = np.random.default_rng(0)
+        for i in range(4):
+            image = rng.integers(0, 256, (120, 160, 3), dtype=np.uint8)
+            cv2.imwrite(str(input_dir / f"img_{i}.jpg"), image)
+        
+        serial = FaceMosaicProcessor(detector_type="haar")
+        serial_stats = serial.process_folder(str(input_dir), str(tmp_path / "serial"))
+        
+        parallel = FaceMosaicProcessor(detector_type="haar", workers=2, chunk_size=1)
+        parallel_stats = parallel.process_folder(str(input_dir), str(tmp_path / "parallel"))
+        
+        for key in ("total", "success", "failed", "skipped", "faces_detected"):
+            assert parallel_stats[key] == serial_stats[key]
+        assert parallel_stats["success"] == 4
+        for i in range(4):
+            name = f"img_{i}.jpg"
+            assert (tmp_path / "parallel" / name).read_bytes() == (tmp_path / "serial" / name).read_bytes()
+    
+    def test_process_folder_parallel_cancel(self, tmp_path):
+        """병렬 처리 취소 테스트"""
+        import cv2
+        
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for i in range(4):
+            cv2.imwrite(str(input_dir / f"img_{i}.jpg"), np.full((50, 50, 3), 128, dtype=np.uint8))
+        
+        processor = FaceMosaicProcessor(detector_type="haar", workers=2, chunk_size=1)
+        stats = processor.process_folder(
+            str(input_dir), str(tmp_path / "output"), cancel_check=lambda: True
+        )
+        
+        assert stats["total"] == 4
+        assert stats["success"] + stats["failed"] <= 4
+    
+    def test_process_folder_pipeline_matches_serial(self, tmp_path):
+        """파이프라인 모드 결과가 순차 처리와 동일한지 테스트"""
+        import cv2
+        
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        rng = np.random.default_rng(1)
+        for i in range(3):
+            image = rng.integers(0, 256, (90, 120, 3), dtype=np.uint8)
+            cv2.imwrite(str(input_dir / f"img_{i}.png"), image)
+        (input_dir / "broken.jpg").write_bytes(b"not an image")
+        
+        serial = FaceMosaicProcessor(detector_type="haar")
+        serial_stats = serial.process_folder(str(input_dir), str(tmp_path / "serial"))
+        
+        piped = FaceMosaicProcessor(
+            detector_type="haar", pipeline=True,
+            read_threads=2, detect_threads=2, write_threads=2, queue_depth=1
+        )
+        piped_stats = piped.process_folder(str(input_dir), str(tmp_path / "piped"))
+        
+        for key in ("total", "success", "failed", "skipped", "faces_detected"):
+            assert piped_stats[key] == serial_stats[key]
+        assert piped_stats["failed"] == 1
+        for i in range(3):
+            name = f"img_{i}.png"
+            assert (tmp_path / "piped" / name).read_bytes() == (tmp_path / "serial" / name).read_bytes()
+    
+    def test_process_folder_detect_batch(self, tmp_path):
+        """감지 배치 크기와 관계없이 결과가 동일한지 테스트"""
+        import cv2
+        
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        rng = np.random.default_rng(2)
+        for i in range(3):
+            image = rng.integers(0, 256, (80, 100, 3), dtype=np.uint8)
+            cv2.imwrite(str(input_dir / f"img_{i}.png"), image)
+        
+        single = FaceMosaicProcessor(detector_type="haar")
+        single_stats = single.process_folder(str(input_dir), str(tmp_path / "single"))
+        
+        batched = FaceMosaicProcessor(detector_type="haar", detect_batch_size=2)
+        batched_stats = batched.process_folder(str(input_dir), str(tmp_path / "batched"))
+        
+        assert batched_stats["success"] == single_stats["success"] == 3
+        for i in range(3):
+            name = f"img_{i}.png"
+            assert (tmp_path / "batched" / name).read_bytes() == (tmp_path / "single" / name).read_bytes()
+    
+    def test_process_folder_incremental(self, tmp_path):
+        """매니페스트 기준 최신 이미지는 건너뛰는지 테스트"""
+        import cv2
+        
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for i in range(3):
+            cv2.imwrite(str(input_dir / f"img_{i}.png"), np.full((40, 40, 3), 50 * i, dtype=np.uint8))
+        output_dir = tmp_path / "output"
+        
+        processor = FaceMosaicProcessor(detector_type="haar", detect_cache=False)
+        stats = processor.process_folder(str(input_dir), str(output_dir))
+        assert stats["success"] == 3
+        assert (output_dir / ".face_mosaic_manifest.jsonl").exists()
+        
+        # 변경 없음: 모두 건너뜀
+        stats = processor.process_folder(str(input_dir), str(output_dir), incremental=True)
+        assert stats["up_to_date"] == 3
+        assert stats["total"] == 0
+        
+        # 원본 1장 변경 + 출력 1장 삭제: 2장만 다시 처리
+        cv2.imwrite(str(input_dir / "img_0.png"), np.full((40, 50, 3), 200, dtype=np.uint8))
+        (output_dir / "img_1.png").unlink()
+        stats = processor.process_folder(str(input_dir), str(output_dir), incremental=True)
+        assert stats["up_to_date"] == 1
+        assert stats["success"] == 2
+        
+        # 설정 변경: 모두 다시 처리
+        blur = FaceMosaicProcessor(detector_type="haar", method="blur", detect_cache=False)
+        stats = blur.process_folder(str(input_dir), str(output_dir), incremental=True)
+        assert stats["up_to_date"] == 0
+        assert stats["success"] == 3
+    
+    def test_iter_process_yields_per_image_results(self, tmp_path):
+        """iter_process가 이미지별 결과를 반환하는지 테스트"""
+        import cv2
+        
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for i in range(2):
+            cv2.imwrite(str(input_dir / f"img_{i}.png"), np.full((40, 40, 3), 90, dtype=np.uint8))
+        (input_dir / "broken.png").write_bytes(b"broken")
+        
+        processor = FaceMosaicProcessor(detector_type="haar", detect_cache=False)
+        results = list(processor.iter_process(str(input_dir), str(tmp_path / "output")))
+        
+        assert len(results) == 3
+        by_name = {Path(r["input_path"]).name: r for r in results}
+        assert by_name["broken.png"]["success"] is False
+        ok = by_name["img_0.png"]
+        assert ok["success"] is True
+        assert ok["face_count"] == len(ok["boxes"]) == 0
+        assert {"load", "detect", "render", "save"} <= set(ok["timings"])
+        assert processor.stats["success"] == 2
+        assert processor.stats["failed"] == 1
+    
+    def test_iter_process_stop_early(self, tmp_path):
+        """반복을 중단하면 남은 이미지는 처리하지 않는지 테스트"""
+        import cv2
+        
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for i in range(4):
+            cv2.imwrite(str(input_dir / f"img_{i}.png"), np.full((40, 40, 3), 90, dtype=np.uint8))
+        output_dir = tmp_path / "output"
+        
+        processor = FaceMosaicProcessor(detector_type="haar", detect_cache=False)
+        for _ in processor.iter_process(str(input_dir), str(output_dir)):
+            break
+        
+        assert processor.stats["success"] == 1
+        assert len(list(output_dir.glob("*.png"))) == 1